@@ -1,12 +1,49 @@
 import asyncio
+import sys
 import aiocoap
 
-from obu_operations import CAR_NAME, FETCH_SID, bitToExteriorLightMap
-import cbor2
+from obu_operations import CAR_NAME, FETCH_SID, bitToExteriorLightMap, cbor2
 
+DEBUG = False
 
-async def main():
-    context = await aiocoap.Context.create_client_context()
+# Client Context and the event loop it belongs to
+_context = None
+_contextLoop = None
+
+async def get_context():
+    """
+    Return the client Context of the running loop, creating it on first use
+    """
+    global _context, _contextLoop
+    loop = asyncio.get_running_loop()
+    if _context is None or _contextLoop is not loop:
+        _context = await aiocoap.Context.create_client_context()
+        _contextLoop = loop
+    return _context
+
+def findBitOffset():
+    """
+    Locate the light status bit by encoding the response layout with two bits.
+    Returns the offset and the payload length it is valid for.
+    """
+    payload = cbor2.dumps({60001: {4: {1: {2: CAR_NAME, 1: 0}}}})
+    flipped = cbor2.dumps({60001: {4: {1: {2: CAR_NAME, 1: 1}}}})
+    diff = [i for i, (a, b) in enumerate(zip(payload, flipped)) if a != b]
+    if len(flipped) != len(payload) or len(diff) != 1:
+        raise ValueError("unexpected response layout")
+    return diff[0], len(payload)
+
+# Offset of the light status bit in responses of the expected layout, which
+# is recognised by its length
+BIT_OFFSET, EXPECTED_LEN = findBitOffset()
+
+
+async def main(count=1):
+    for _ in range(count):
+        await fetch()
+
+async def fetch():
+    context = await get_context()
 
     # CoAP FETCH with request body car name ""
     req = aiocoap.Message(
@@ -18,15 +55,26 @@ async def main():
     try:
         resp = await context.request(req).response
         print(f"Code: {resp.code}")
-        output = cbor2.loads(resp.payload)
-        # light status
-        index = (output[60001][4][1][1])
-        lightStatus = bitToExteriorLightMap[index]
-        print("Payload", output)
+        if len(resp.payload) == EXPECTED_LEN:
+            # light status, read straight from its byte instead of decoding
+            lightStatus = bitToExteriorLightMap[resp.payload[BIT_OFFSET]]
+            output = cbor2.loads(resp.payload) if DEBUG else None
+        else:
+            # another layout (e.g. a pycoreconf stencil): decode it
+            output = cbor2.loads(resp.payload)
+            try:
+                lightStatus = bitToExteriorLightMap[output[60001][4][1][1]]
+            except (LookupError, TypeError):
+                raise ValueError(f"unexpected response {resp.payload!r}") from None
+        print("Light status", lightStatus)
+        if DEBUG:
+            assert bitToExteriorLightMap[output[60001][4][1][1]] == lightStatus
+            print("Payload", output)
         #print(f"Payload: {resp.payload.decode(errors='ignore')}")
     except Exception as e:
         print("Failed to fetch:", e)
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Optional argument: number of requests, all sent over one Context
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 1))
 
@@ -1,7 +1,13 @@
 import requests
 import json
+import orjson
+from requests.adapters import HTTPAdapter
 from obu_operations import CAR_NAME
 
+# Shared session so repeated calls reuse keep-alive connections
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=16, pool_maxsize=64))
+
 def main():
     url = "http://localhost:4000/jsonrpc"
 
@@ -21,7 +27,8 @@ def main():
      }
 
 
-    response = requests.post(url, json=payload).json()
+    response = SESSION.post(url, data=orjson.dumps(payload),
+                            headers={"Content-Type": "application/json"}).json()
     print(response)
 
 if __name__ == "__main__":
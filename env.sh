@@ -2,8 +2,13 @@ export REST_URL="http://192.168.50.254:5000/externalLights"
 export JSONRPC_URL="http://192.168.50.254:4000/jsonrpc"
 export COAP_HOST="192.168.50.254"
 export COAP_PORT="5683"
+export COAP_CONCURRENCY="1" # CoAP requests in flight per user
+export COAP_NON="0" # 1: send CoAP requests as NON (needed to pipeline)
+export COAP_TARGET_RPS="0" # >0: cap in-flight CoAP requests to RPS x mean RTT
+export HTTP_POOL_SIZE="256" # HTTP connections per host, per worker process
 
 # Optional: select which users to run
 export ENABLE_JSONRPC="1" # set to 0 to disable
 export ENABLE_COAP="1" # set to 0 to disable
+export JSONRPC_HTTP2="0" # 1: JSON-RPC over HTTP/2 via httpx
 export ENABLE_REST="1"
@@ -8,141 +8,154 @@ It reuses the same request semantics as your uploaded clients:
 Run
 ---
 # Install deps
-pip install locust requests aiocoap cbor2
+pip install locust aiocoap "cbor2>=5.4" orjson
 
 # Env configuration (defaults shown)
 export JSONRPC_URL="http://localhost:4000/jsonrpc"
 export COAP_HOST="localhost"
 export COAP_PORT="5683"
+export COAP_CONCURRENCY="1"  # CoAP requests in flight per user
+export COAP_NON="0"          # 1: send CoAP requests as NON (needed to pipeline)
+export COAP_TARGET_RPS="0"   # >0: cap in-flight CoAP requests to RPS x mean RTT
+export HTTP_POOL_SIZE="256"  # HTTP connections per host, per worker process
 # Optional: select which users to run
 export ENABLE_JSONRPC="1"   # set to 0 to disable
 export ENABLE_COAP="1"      # set to 0 to disable
+export JSONRPC_HTTP2="0"    # 1: JSON-RPC over HTTP/2 via httpx (pip install "httpx[http2]")
 
 # Headless 10 users for 10 minutes, spawn rate 2/s
 locust -f locustfile.py --headless -u 10 -r 2 -t 10m
 
+# Same, with one worker process per core (escapes the single-GIL ceiling)
+locust -f locustfile.py --processes -1 --headless -u $U -r $R -t $T
+
 # Web UI
 locust -f locustfile.py
 
 Notes
 -----
 * Locust is gevent-based; aiocoap is asyncio-based. We create a dedicated
-  asyncio loop in a background thread for CoAP and submit coroutines to it.
-* Latency is measured wall-clock (time.monotonic). We report to Locust via
-  events.request.fire with request_type "JSONRPC" or "COAP" and name "fetch".
-* For CoAP, we pre-create a client Context and reuse it for all requests.
+  asyncio loop in a background thread for CoAP (and the optional HTTP/2
+  JSON-RPC client) and submit coroutines to it.
+* HTTP users (JSON-RPC, REST) are FastHttpUser based; Locust times and
+  reports those requests itself, we only relabel request_type to "JSONRPC"
+  or "REST".
+* CoAP latency is measured per request with time.perf_counter_ns. We report
+  to Locust via events.request.fire with request_type "COAP" and name "fetch".
+* Each CoAP task run issues COAP_CONCURRENCY requests at once and reports
+  every one of them individually. Requests are CON by default; aiocoap keeps
+  only one CON exchange per server in flight (NSTART=1), so pipelining needs
+  COAP_NON=1. NON changes what is measured and is therefore opt-in.
+  COAP_TARGET_RPS additionally caps the requests in flight per worker to
+  target_rps * mean(last 8 RTTs), re-evaluated every second. Requests that
+  time out waiting for a slot are not sent and are reported as "dropped".
+* For CoAP, we pre-create a client Context and a request Message template
+  and reuse them for all requests.
+* With --processes each worker is a forked process: the CoAP loop/Context
+  is created lazily in on_start and HTTP connections are opened on first
+  use, so every worker gets its own. The init hook logs the runner type
+  (master/worker), the worker client id and the pid of every process.
 * You can tag tasks with @tag and use --tags include/exclude if needed.
 """
 from __future__ import annotations
 import os
-import time
+import sys
+from time import perf_counter_ns
 import json
+import logging
 import threading
 import asyncio
 from typing import Optional
 
-import requests
+import orjson
 from locust import User, task, between, events
+from locust.contrib.fasthttp import FastHttpUser
+from geventhttpclient.client import HTTPClientPool
 
 # Reuse constants from your codebase
-from obu_operations import CAR_NAME, FETCH_SID  # noqa: F401
+from obu_operations import CAR_NAME, FETCH_SID, cbor2  # noqa: F401
+
+# Request bodies never change, encode them once
+JSONRPC_BODY = orjson.dumps({"jsonrpc": "2.0", "method": "fetch", "params": [CAR_NAME], "id": 1})
+REST_BODY = orjson.dumps({"carName": CAR_NAME})
+CAR_NAME_BYTES = CAR_NAME.encode()
+HEADERS = {"Content-Type": "application/json"}
+
+JSONRPC_HTTP2 = os.getenv("JSONRPC_HTTP2", "0") == "1"
+COAP_CONCURRENCY = int(os.getenv("COAP_CONCURRENCY", "1"))
+COAP_NON = os.getenv("COAP_NON", "0") == "1"
+COAP_TARGET_RPS = float(os.getenv("COAP_TARGET_RPS", "0"))  # 0: no adaptive window
+
+# Shared per failure class / per event instead of allocating one per request
+_BAD_JSON = Exception("Bad JSON")
+_EMPTY_CTX: dict = {}
+
+# One HTTP client pool per worker process shared by all HTTP users, so the
+# number of sockets is bounded by HTTP_POOL_SIZE instead of the user count.
+# Connections are opened on first use, i.e. after locust forked its workers.
+_HTTP_POOL = HTTPClientPool(
+    concurrency=int(os.getenv("HTTP_POOL_SIZE", "256")),
+    network_timeout=10.0,
+    connection_timeout=10.0,
+)
+
+@events.init.add_listener
+def _log_process(environment, **kwargs):
+    # --processes forks with gevent.fork, so multiprocessing names are all
+    # "MainProcess"; the runner type, worker client id and pid tell them apart
+    runner = environment.runner
+    logging.info("locust %s initialised (pid %d, client id %s)", type(runner).__name__,
+                 os.getpid(), getattr(runner, "client_id", "-"))
 
 # ------------------------- JSON-RPC User (HTTP) ------------------------- #
-class JsonRpcUser(User):
+# FastHttpUser (geventhttpclient) instead of requests.Session: far less CPU per
+# request on the load generator, so the benchmark stays server-bound.
+class JsonRpcUser(FastHttpUser):
     wait_time = between(0.01, 0.05)
     abstract = True  # toggled via subclassing below
+    host = os.getenv("JSONRPC_URL", "http://localhost:4000/jsonrpc")
+    client_pool = _HTTP_POOL
 
     def on_start(self):
         self.url = os.getenv("JSONRPC_URL", "http://localhost:4000/jsonrpc")
-        self.session = requests.Session()
 
     @task
     def fetch(self):
-        payload = {
-            "jsonrpc": "2.0",
-            "method": "fetch",
-            "params": [CAR_NAME],
-            "id": 1,
-        }
-        start = time.monotonic()
-        try:
-            resp = self.session.post(self.url, json=payload, timeout=10)
-            elapsed_ms = (time.monotonic() - start) * 1000
-            ok = (resp.status_code == 200)
-            # Try to parse JSON for minimal validation
-            try:
-                _ = resp.json()
-            except Exception:
-                ok = False
-            events.request.fire(
-                request_type="JSONRPC",
-                name="fetch",
-                response_time=elapsed_ms,
-                response_length=len(resp.content),
-                response=resp,
-                context={},
-                exception=None if ok else Exception(f"Bad status or JSON: {resp.status_code}"),
-            )
-        except Exception as e:
-            elapsed_ms = (time.monotonic() - start) * 1000
-            events.request.fire(
-                request_type="JSONRPC",
-                name="fetch",
-                response_time=elapsed_ms,
-                response_length=0,
-                response=None,
-                context={},
-                exception=e,
-            )
-
-# Concrete user enabled/disabled via env
-if os.getenv("ENABLE_JSONRPC", "1") == "1":
+        with self.client.post(self.url, data=JSONRPC_BODY, headers=HEADERS,
+                              name="fetch", catch_response=True) as resp:
+            resp.request_meta["request_type"] = "JSONRPC"
+            # Fixed-shape JSON object reply; a prefix check is enough validation.
+            # Connection errors and bad status codes are left for locust to
+            # report with their real exception.
+            if getattr(resp, "error", None) is None and not resp.content.startswith(b'{"'):
+                resp.failure(_BAD_JSON)
+
+# Concrete user enabled/disabled via env (JSONRPC_HTTP2=1 selects the httpx
+# HTTP/2 variant further below instead)
+if os.getenv("ENABLE_JSONRPC", "1") == "1" and not JSONRPC_HTTP2:
     class JSONRPCUser(JsonRpcUser):
         abstract = False
 
 # --------------------------- RESTful JSON API User (HTTP) --------------------------- #
 # Matches your client that POSTs to /externalLights with {"carName": CAR_NAME}
-# and expects JSON back. Uses a persistent requests.Session for keep-alive.
-class RestApiUser(User):
+# and expects JSON back. Connections are kept alive in the shared pool.
+class RestApiUser(FastHttpUser):
     wait_time = between(0.01, 0.05)
     abstract = True
     weight = int(os.getenv("REST_WEIGHT", "1"))
+    host = os.getenv("REST_URL", "http://localhost:5000/externalLights")
+    client_pool = _HTTP_POOL
 
     def on_start(self):
         self.url = os.getenv("REST_URL", "http://localhost:5000/externalLights")
-        self.session = requests.Session()
 
     @task
     def external_lights(self):
-        start = time.monotonic()
-        try:
-            resp = self.session.post(self.url, json={"carName": CAR_NAME}, timeout=10)
-            elapsed_ms = (time.monotonic() - start) * 1000
-            ok = resp.ok
-            try:
-                _ = resp.json()
-            except Exception:
-                ok = False
-            events.request.fire(
-                request_type="REST",
-                name="externalLights",
-                response_time=elapsed_ms,
-                response_length=len(resp.content),
-                response=resp,
-                context={},
-                exception=None if ok else Exception(f"Bad status or JSON: {resp.status_code}"),
-            )
-        except Exception as e:
-            elapsed_ms = (time.monotonic() - start) * 1000
-            events.request.fire(
-                request_type="REST",
-                name="externalLights",
-                response_time=elapsed_ms,
-                response_length=0,
-                response=None,
-                context={},
-                exception=e,
-            )
+        with self.client.post(self.url, data=REST_BODY, headers=HEADERS,
+                              name="externalLights", catch_response=True) as resp:
+            resp.request_meta["request_type"] = "REST"
+            if getattr(resp, "error", None) is None and not resp.content.startswith(b'{"'):
+                resp.failure(_BAD_JSON)
 
 if os.getenv("ENABLE_REST", "1") == "1":
     class RESTUser(RestApiUser):
@@ -150,98 +163,331 @@ if os.getenv("ENABLE_REST", "1") == "1":
 
 
 
-# --------------------------- CoAP User (UDP) --------------------------- #
+# ---------------------- Background asyncio loop ---------------------- #
 # Robust fix for Python 3.12 + gevent:
-# Create ONE global asyncio event loop in a dedicated OS thread and a single
-# aiocoap client Context bound to that loop. All Locust users submit their
-# CoAP coroutines to that background loop via run_coroutine_threadsafe.
+# Create ONE global asyncio event loop in a dedicated OS thread hosting a
+# single aiocoap client Context (and, with JSONRPC_HTTP2=1, one shared httpx
+# HTTP/2 client). All Locust users submit their coroutines to that background
+# loop via run_coroutine_threadsafe.
 # This avoids calling run_until_complete() inside Locust greenlets and
 # eliminates the "another loop is running" error.
-from aiocoap import Message, Context, FETCH  # type: ignore
-import cbor2  # type: ignore
-
-class _GlobalCoap:
+import collections
+import concurrent.futures
+import copy
+import ipaddress
+import statistics
+from aiocoap import Message, Context, FETCH, CON, NON  # type: ignore
+from aiocoap.message import UndecidedRemote  # type: ignore
+from aiocoap.util import hostportjoin  # type: ignore
+if JSONRPC_HTTP2:
+    # optional: pip install "httpx[http2]". httpcore only uses trio on trio
+    # event loops, but imports it if installed, and trio fails to import once
+    # gevent has patched select (no epoll). Hide it so httpcore uses anyio.
+    sys.modules.setdefault("trio", None)  # type: ignore
+    # httpcore is imported lazily by the client, so pull it in here to fail
+    # at startup rather than per user.
+    import httpcore  # type: ignore  # noqa: F401
+    import httpx  # type: ignore
+    # httpx logs every request at INFO, which locust would print
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+class _GlobalAIOLoop:
     _instance = None
+    _error: Optional[BaseException] = None
+    _lock = threading.Lock()
 
-    def __init__(self, host: str, port: int, path: str):
+    def __init__(self):
         import threading
-        self.host = host
-        self.port = port
-        self.path = path
-        self._ready = threading.Event()
+        self.host = os.getenv("COAP_HOST", "localhost")
+        self.port = int(os.getenv("COAP_PORT", "5683"))
+        self.path = os.getenv("COAP_PATH", os.getenv("FETCH_SID", str(FETCH_SID)))
+        # Request template with the URI already split into options, so we skip
+        # aiocoap's URI parsing per request. Only the payload changes per call;
+        # token and message ID are assigned by aiocoap on each copy.
+        self._uri_path_opts = tuple(self.path.split("/"))
+        self._template = Message(code=FETCH)
+        self._template.remote = UndecidedRemote("coap", hostportjoin(self.host, self.port))
+        try:
+            ipaddress.ip_address(self.host)  # IP literals are not sent as Uri-Host
+        except ValueError:
+            self._template.opt.uri_host = self.host
+        self._template.opt.uri_path = self._uri_path_opts
+        # Resolved by _setup on the loop, carrying its exception if it failed
+        self._started: concurrent.futures.Future = concurrent.futures.Future()
         self._loop = asyncio.new_event_loop()
         self._ctx: Context | None = None
-        self._thread = threading.Thread(target=self._runner, name="coap-loop", daemon=True)
+        self._httpx = None
+        # Adaptive window of outstanding CoAP requests (COAP_TARGET_RPS > 0),
+        # sized from the mean of the last 8 RTTs (seconds)
+        self._rtt_samples: collections.deque = collections.deque(maxlen=8)
+        self._outstanding = 0
+        self._window = COAP_CONCURRENCY
+        self._window_changed: asyncio.Condition | None = None
+        # Length of a validated CoAP response, see CoapUser.fetch
+        self.expected_len: Optional[int] = None
+        self._thread = threading.Thread(target=self._runner, name="aio-loop", daemon=True)
         self._thread.start()
-        if not self._ready.wait(timeout=10):
-            raise RuntimeError("CoAP background loop failed to start")
+        try:
+            self._started.result(timeout=10)
+        except BaseException as e:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            if isinstance(e, concurrent.futures.TimeoutError):
+                raise RuntimeError("asyncio background loop failed to start") from e
+            raise
 
     def _runner(self):
         asyncio.set_event_loop(self._loop)
         async def _setup():
-            self._ctx = await Context.create_client_context()
-            self._ready.set()
+            try:
+                self._ctx = await Context.create_client_context()
+                if COAP_TARGET_RPS > 0:
+                    self._window_changed = asyncio.Condition()
+                    self._loop.create_task(self._resize_window())
+                if JSONRPC_HTTP2:
+                    # http1=False: HTTP/2 also over cleartext (prior knowledge)
+                    self._httpx = httpx.AsyncClient(
+                        http1=False,
+                        http2=True,
+                        timeout=10.0,
+                        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+                    )
+            except BaseException as e:
+                if self._ctx is not None:
+                    await self._ctx.shutdown()
+                self._started.set_exception(e)
+            else:
+                self._started.set_result(None)
         self._loop.create_task(_setup())
         self._loop.run_forever()
 
     @classmethod
-    def get(cls, host: str, port: int, path: str) -> "_GlobalCoap":
-        if cls._instance is None:
-            cls._instance = _GlobalCoap(host, port, path)
+    def get(cls) -> "_GlobalAIOLoop":
+        # Users spawned together would otherwise each start a loop while the
+        # first one waits for _setup. A failed start is remembered, so later
+        # users get the same error right away instead of retrying.
+        with cls._lock:
+            if cls._error is not None:
+                raise cls._error
+            if cls._instance is None:
+                try:
+                    cls._instance = _GlobalAIOLoop()
+                except BaseException as e:
+                    cls._error = e
+                    raise
         return cls._instance
 
-    def fetch(self, car_name: str, timeout: float = 10.0) -> bytes:
+    @property
+    def target_outstanding(self) -> int:
+        """
+        Outstanding requests needed for COAP_TARGET_RPS at the recent mean RTT.
+        """
+        if not self._rtt_samples:
+            return self._window
+        return max(1, int(COAP_TARGET_RPS * statistics.mean(self._rtt_samples)))
+
+    async def _resize_window(self):
+        while True:
+            await asyncio.sleep(1)
+            async with self._window_changed:
+                self._window = self.target_outstanding
+                self._window_changed.notify_all()
+
+    async def _acquire(self):
+        async with self._window_changed:
+            await self._window_changed.wait_for(lambda: self._outstanding < self._window)
+            self._outstanding += 1
+
+    async def _release(self):
+        async with self._window_changed:
+            self._outstanding -= 1
+            self._window_changed.notify()
+
+    def fetch_many(self, car_names: list[bytes], non: bool = False,
+                   timeout: float = 10.0) -> list[tuple[float, Optional[bytes], Optional[Exception]]]:
+        """
+        Issue one FETCH per entry in car_names concurrently and wait for all,
+        as NON messages if non is set, CON otherwise.
+        Returns (response_time_ms, payload, exception) for each request.
+        With COAP_TARGET_RPS set, requests first wait for a slot in the window;
+        one that never got a slot is not sent and has payload None and the
+        time it waited.
+        """
         assert self._ctx is not None
-        uri = f"coap://{self.host}:{self.port}/{self.path}"
-        req = Message(code=FETCH, uri=uri, payload=car_name.encode())
+        windowed = self._window_changed is not None
+        mtype = NON if non else CON
+        async def _do(car_name: bytes):
+            _now = perf_counter_ns
+            req = copy.copy(self._template)
+            req.payload = car_name
+            req.mtype = mtype
+            if windowed:
+                t0 = _now()
+                try:
+                    await asyncio.wait_for(self._acquire(), timeout)
+                except Exception as e:
+                    return (_now() - t0) / 1_000_000, None, e
+            t0 = _now()
+            try:
+                # NON requests are not retransmitted: bound each one so a lost
+                # datagram fails only its own request, not the whole batch
+                # (CON ones give up after aiocoap's retransmissions anyway)
+                resp = await asyncio.wait_for(self._ctx.request(req).response, timeout)
+                rtt = _now() - t0
+                self._rtt_samples.append(rtt / 1_000_000_000)
+                return rtt / 1_000_000, resp.payload, None
+            except Exception as e:
+                return (_now() - t0) / 1_000_000, b"", e
+            finally:
+                if windowed:
+                    await self._release()
+        async def _batch():
+            return await asyncio.gather(*[_do(n) for n in car_names])
+        fut = asyncio.run_coroutine_threadsafe(_batch(), self._loop)
+        # the per-request timeouts (window wait + request) fire first
+        try:
+            return fut.result(timeout=2 * timeout + 1)
+        except concurrent.futures.TimeoutError:
+            # the user reports the batch as failed and moves on, do not leave
+            # its requests queued on the window behind the next batch
+            fut.cancel()
+            raise
+
+    def post(self, url: str, body: bytes, headers: dict, timeout: float = 10.0):
+        """
+        POST body over the shared HTTP/2 client.
+        Returns (response_time_ms, httpx.Response).
+        """
+        assert self._httpx is not None
         async def _do():
-            resp = await self._ctx.request(req).response
-            return resp.payload
+            t0 = perf_counter_ns()
+            resp = await self._httpx.post(url, content=body, headers=headers)
+            return (perf_counter_ns() - t0) / 1_000_000, resp
         fut = asyncio.run_coroutine_threadsafe(_do(), self._loop)
-        return fut.result(timeout=timeout)
-
-class CoapUser(User):
+        try:
+            return fut.result(timeout=timeout)
+        except concurrent.futures.TimeoutError:
+            # the user reports the failure now, free the stream and pool slot
+            fut.cancel()
+            raise
+
+# ------------------------ JSON-RPC User (HTTP/2) ------------------------ #
+# Opt-in with JSONRPC_HTTP2=1: multiplexes all JSON-RPC requests of this worker
+# over few HTTP/2 connections. Needs an HTTP/2 capable server in front of the
+# JSON-RPC service (e.g. hypercorn or nginx); servexample.py is HTTP/1.1 only.
+class JsonRpcHttp2User(User):
     wait_time = between(0.01, 0.05)
     abstract = True
 
     def on_start(self):
-        host = os.getenv("COAP_HOST", "localhost")
-        port = int(os.getenv("COAP_PORT", "5683"))
-        path = os.getenv("COAP_PATH", os.getenv("FETCH_SID", str(FETCH_SID)))
-        self._coap = _GlobalCoap.get(host, port, path)
+        self.url = os.getenv("JSONRPC_URL", "http://localhost:4000/jsonrpc")
+        self._aio = _GlobalAIOLoop.get()
 
     @task
     def fetch(self):
-        start = time.monotonic()
+        start = perf_counter_ns()
         try:
-            payload = self._coap.fetch(CAR_NAME)
-            elapsed_ms = (time.monotonic() - start) * 1000
-            try:
-                _ = cbor2.loads(payload)
+            elapsed_ms, resp = self._aio.post(self.url, JSONRPC_BODY, HEADERS)
+            if resp.status_code != 200:
+                exc = Exception(f"Bad status: {resp.status_code}")
+            elif not resp.content.startswith(b'{"'):
+                exc = _BAD_JSON
+            else:
                 exc = None
-            except Exception as de:
-                exc = de
             events.request.fire(
-                request_type="COAP",
+                request_type="JSONRPC",
                 name="fetch",
                 response_time=elapsed_ms,
-                response_length=len(payload),
-                response=None,
-                context={},
+                response_length=len(resp.content),
+                response=resp,
+                context=_EMPTY_CTX,
                 exception=exc,
             )
         except Exception as e:
-            elapsed_ms = (time.monotonic() - start) * 1000
+            elapsed_ms = (perf_counter_ns() - start) / 1_000_000
             events.request.fire(
-                request_type="COAP",
+                request_type="JSONRPC",
                 name="fetch",
                 response_time=elapsed_ms,
                 response_length=0,
                 response=None,
-                context={},
+                context=_EMPTY_CTX,
                 exception=e,
             )
 
+if os.getenv("ENABLE_JSONRPC", "1") == "1" and JSONRPC_HTTP2:
+    class JSONRPCUser(JsonRpcHttp2User):
+        abstract = False
+
+# --------------------------- CoAP User (UDP) --------------------------- #
+class CoapUser(User):
+    wait_time = between(0.01, 0.05)
+    abstract = True
+    # Outstanding CoAP requests per task run; CoAP/UDP has no connection state,
+    # so each user can keep several in flight at once, but only as NON:
+    # aiocoap serializes CON requests to the same server (NSTART=1).
+    concurrency: int = COAP_CONCURRENCY
+    non: bool = COAP_NON
+    _warned_serialized = False
+
+    def on_start(self):
+        self._coap = _GlobalAIOLoop.get()
+        if self.concurrency > 1 and not self.non and not CoapUser._warned_serialized:
+            CoapUser._warned_serialized = True
+            logging.warning("COAP_CONCURRENCY=%d with CON requests: aiocoap sends them "
+                            "one at a time, set COAP_NON=1 to pipeline", self.concurrency)
+
+    @task
+    def fetch(self):
+        start = perf_counter_ns()
+        try:
+            results = self._coap.fetch_many([CAR_NAME_BYTES] * self.concurrency, self.non)
+        except Exception as e:
+            elapsed_ms = (perf_counter_ns() - start) / 1_000_000
+            for _ in range(self.concurrency):
+                events.request.fire(
+                    request_type="COAP",
+                    name="fetch",
+                    response_time=elapsed_ms,
+                    response_length=0,
+                    response=None,
+                    context=_EMPTY_CTX,
+                    exception=e,
+                )
+            return
+        for elapsed_ms, payload, exc in results:
+            if payload is None:
+                # Never sent (no window slot): reported under its own name so
+                # it does not skew the fetch response times
+                events.request.fire(
+                    request_type="COAP",
+                    name="dropped",
+                    response_time=elapsed_ms,
+                    response_length=0,
+                    response=None,
+                    context=_EMPTY_CTX,
+                    exception=exc,
+                )
+                continue
+            # Responses have a fixed layout: decode only until one has been
+            # validated, afterwards a matching length is enough
+            if exc is None and len(payload) != self._coap.expected_len:
+                try:
+                    _ = cbor2.loads(payload)
+                except Exception as de:
+                    exc = de
+                else:
+                    if self._coap.expected_len is None:
+                        self._coap.expected_len = len(payload)
+            events.request.fire(
+                request_type="COAP",
+                name="fetch",
+                response_time=elapsed_ms,
+                response_length=len(payload),
+                response=None,
+                context=_EMPTY_CTX,
+                exception=exc,
+            )
+
 if os.getenv("ENABLE_COAP", "1") == "1":
     class COAPUser(CoapUser):
         abstract = False
@@ -1,60 +1,84 @@
 import time
 import random
+import asyncio
+from typing import Optional, Union
+
+# cbor2 for the CoAP scripts, imported from here so its location is handled
+# once. C extension only: fail loudly rather than fall back to pure-Python cbor2
+try:
+    import cbor2._cbor2 as cbor2  # type: ignore  # cbor2 >= 6
+except ImportError:
+    import _cbor2 as cbor2  # type: ignore  # cbor2 5.x
 
 # Constants
 CAR_NAME = "roadrunner"
 FETCH_SID = "60001"
 
-bitToExteriorLightMap = {0:"lowBeamHeadlightsOn",
-            1:"highBeamHeadlightsOn",
-            2:"leftTurnSignalOn",
-            3:"rightTurnSignalOn",
-            4:"daytimeRunningLightsOn",
-            5:"reverseLightOn",
-            6:"fogLightOn",
-            7:"parkingLightsOn"}
-
-
-def returnYANGOutput(status):
-
-    outputMessage = {
-      "fetch": {
-        "output" : {
-        "carStatus": {
-          "name": CAR_NAME,
-          "exteriorLight": status
-        }
-      }}
+# Indexed by bit, exactly 8 entries so a 3 bit random number picks one
+EXTERIOR_LIGHTS = ("lowBeamHeadlightsOn",
+            "highBeamHeadlightsOn",
+            "leftTurnSignalOn",
+            "rightTurnSignalOn",
+            "daytimeRunningLightsOn",
+            "reverseLightOn",
+            "fogLightOn",
+            "parkingLightsOn")
+
+bitToExteriorLightMap = dict(enumerate(EXTERIOR_LIGHTS))
+exteriorLightToBit = {v: k for k, v in enumerate(EXTERIOR_LIGHTS)}
+
+
+# Response skeleton shared by every returnYANGOutput call
+yangOutput: dict = {
+  "fetch": {
+    "output" : {
+    "carStatus": {
+      "name": CAR_NAME,
+      "exteriorLight": None
     }
+  }}
+}
+yangCarStatus: dict = yangOutput["fetch"]["output"]["carStatus"]
+
 
-    return outputMessage
+def returnYANGOutput(status: Optional[Union[str, int]]) -> dict:
+    """
+    Fill in status and return the shared output message.
+    status is None for an unknown car (servexample) and -1 for the stencil.
+    The same dict is returned each call, serialize it before calling again.
+    """
+    yangCarStatus["exteriorLight"] = status
+    return yangOutput
 
-def returnCCOutput(stencilPayload, status):
-    # Find the code
-    bit = list(filter(lambda key: bitToExteriorLightMap[key] == status, bitToExteriorLightMap))[0]
+def returnCCOutput(stencilPayload: dict, status: str) -> dict:
     # Generated from pycoreconf
     stencilPayload[60001][4][1][2] = CAR_NAME
-    stencilPayload[60001][4][1][1] = bit
+    stencilPayload[60001][4][1][1] = exteriorLightToBit[status]
 
     return stencilPayload
 
 
 
-def lightStatus():
+def lightStatus() -> str:
     """
     Randomly send a light status
     """
-    index = random.randint(0, len(bitToExteriorLightMap)-1)
-    status = bitToExteriorLightMap[index]
-    return status
+    return EXTERIOR_LIGHTS[random.getrandbits(3)]
 
 
-def shortTask():
+def shortTask() -> str:
     time.sleep(0.1)
     status = lightStatus()
     return status
 
-def longTask():
+async def shortTaskAsync() -> str:
+    """
+    Non-blocking shortTask for asyncio servers
+    """
+    await asyncio.sleep(0.1)
+    return lightStatus()
+
+def longTask() -> str:
     time.sleep(0.5)
     return lightStatus()
 
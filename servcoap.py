@@ -1,8 +1,11 @@
+import argparse
 import asyncio
+import copy
+import os
+import signal
 import aiocoap.resource as resource
 import aiocoap
-from obu_operations import CAR_NAME, FETCH_SID, shortTask, returnCCOutput, returnYANGOutput
-import cbor2
+from obu_operations import CAR_NAME, FETCH_SID, EXTERIOR_LIGHTS, shortTaskAsync, returnCCOutput, returnYANGOutput, cbor2
 
 
 """
@@ -20,13 +23,22 @@ stencilPayload = cbor2.loads(stencilPayload)
 # Incase cannot install pycoreconf
 stencilPayload = {60001: {4: {1: {2: 'roadrunner', 1: -1}}}}
 
+# Only the light status varies, so serialize every possible response once.
+# The stencil is copied, never mutated, so concurrent requests share nothing
+# but these immutable bytes.
+precomputedPayloads = {status: cbor2.dumps(returnCCOutput(copy.deepcopy(stencilPayload), status))
+                       for status in EXTERIOR_LIGHTS}
+# The bit encodes as a single CBOR byte: all responses have the same layout
+# and differ only at that one offset
+assert len({len(p) for p in precomputedPayloads.values()}) == 1
+carNameBytes = CAR_NAME.encode()
+
 class FetchDemoResource(resource.Resource):
     async def render_fetch(self, request: aiocoap.Message) -> aiocoap.Message:
         # Check request body; do the "something" (sleep 1s) when car name matches
-        if request.payload == CAR_NAME.encode():
-            lightStatus = shortTask()
-            output = returnCCOutput(stencilPayload, lightStatus)
-            payload = cbor2.dumps(output)
+        if request.payload == carNameBytes:
+            lightStatus = await shortTaskAsync()
+            payload = precomputedPayloads[lightStatus]
             
             #print("OT", payload)
 
@@ -48,6 +60,50 @@ async def main():
     # Keep the server running forever
     await asyncio.get_running_loop().create_future()
 
+def serve(workers):
+    """
+    Run the server in `workers` processes bound to the same UDP port.
+
+    aiocoap's udp6 transport sets SO_REUSEPORT on its server socket, so the
+    kernel spreads datagrams across the processes (hashed per client address,
+    so retransmissions reach the same worker). Fork before any loop exists so
+    every process gets its own event loop and aiocoap Context.
+
+    The parent serves too and owns the workers: when it stops (SIGINT,
+    SIGTERM or an error) it terminates and reaps them. An orphaned worker
+    would keep its reused port and silently take part of the next run's
+    traffic.
+    """
+    children = []
+    for _ in range(workers - 1):
+        pid = os.fork()
+        if pid == 0:
+            children = []  # workers do not own their siblings
+            break
+        children.append(pid)
+    if not children:
+        asyncio.run(main())
+        return
+
+    def stop(signum, frame):
+        raise SystemExit(128 + signum)
+    signal.signal(signal.SIGINT, stop)
+    signal.signal(signal.SIGTERM, stop)
+    try:
+        asyncio.run(main())
+    finally:
+        for pid in children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        for pid in children:
+            os.waitpid(pid, 0)
+
 if __name__ == "__main__":
-    asyncio.run(main())
+    parser = argparse.ArgumentParser(description="CoAP/CORECONF fetch server")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="number of server processes sharing port 5683")
+    args = parser.parse_args()
+    serve(args.workers)
 
@@ -1,20 +1,32 @@
 
-from flask import Flask, render_template, request, redirect, jsonify
-from obu_operations import CAR_NAME, shortTask, returnYANGOutput
+import os
 
-import logging
-log = logging.getLogger('werkzeug')
-log.setLevel(logging.ERROR)
+import orjson
+import uvicorn
+from fastapi import FastAPI, HTTPException, Response
+from pydantic import BaseModel
+from obu_operations import CAR_NAME, shortTaskAsync, returnYANGOutput
 
-app = Flask(__name__)
+"""
+Run with:
+    uvicorn servrestful:app --host 0.0.0.0 --port 5000 --loop uvloop --http httptools --workers $(nproc)
+"""
 
-@app.route('/externalLights', methods=['POST'])
-def handleLight():
-    requestCarName = request.json["carName"]
-    if requestCarName == CAR_NAME:
-        status = shortTask()
-        output = returnYANGOutput(status)
-        return output
+app = FastAPI()
+
+class LightReq(BaseModel):
+    carName: str
+
+@app.post('/externalLights')
+async def handleLight(payload: LightReq):
+    if payload.carName != CAR_NAME:
+        raise HTTPException(status_code=404, detail="unknown car")
+    status = await shortTaskAsync()
+    # returnYANGOutput reuses one dict; serialize it right away, before the
+    # handler yields to another request. Plain Response with orjson bytes:
+    # ORJSONResponse is deprecated and warns on every instantiation.
+    return Response(orjson.dumps(returnYANGOutput(status)), media_type="application/json")
 
 if __name__ == '__main__':
-    app.run(host= '0.0.0.0',debug=True, port=5000)
+    uvicorn.run("servrestful:app", host='0.0.0.0', port=5000, loop="uvloop", http="httptools",
+                workers=os.cpu_count(), log_level="error")